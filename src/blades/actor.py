@@ -22,20 +22,24 @@ class _RayActor(object):
     
     def local_training(self, clients, model, local_round, lr):
         update = []
+        state_dict = model.state_dict()
         for i in range(len(clients)):
-            clients[i].set_para(model)
+            clients[i].set_para(state_dict)
             clients[i].set_lr(lr)
             clients[i].on_train_round_begin()
             data = self.dataset.get_train_data(clients[i].id(), local_round)
             clients[i].local_training(data_batches=data)
             clients[i].on_train_round_end()
-            update.append(clients[i].get_update())
+            # Return NumPy arrays so Ray can ship the updates through the
+            # object store zero-copy instead of pickling torch tensors.
+            update.append(clients[i].get_update().numpy())
         return update
     
     def evaluate(self, clients, model, round_number, batch_size, metrics):
         update = []
+        state_dict = model.state_dict()
         for i in range(len(clients)):
-            clients[i].set_para(model)
+            clients[i].set_para(state_dict)
             data = self.dataset.get_all_test_data(clients[i].id())
             result = clients[i].evaluate(
                 round_number=round_number,
@@ -33,16 +33,16 @@ class Centeredclipping(_BaseAggregator):
         return v * scale
     
     def __call__(self, clients):
-        updates = list(map(lambda w: w.get_update(), clients))
+        updates = self._get_updates(clients)
         if self.momentum is None:
             self.momentum = torch.zeros_like(updates[0])
-        
+
         for _ in range(self.n_iter):
-            self.momentum = (
-                    sum(self.clip(v - self.momentum) for v in updates) / len(updates)
-                    + self.momentum
-            )
-        
+            diffs = updates - self.momentum
+            norms = torch.linalg.vector_norm(diffs, dim=1).clamp(min=1e-12)
+            scales = torch.clamp(self.tau / norms, max=1.0)
+            self.momentum.add_((diffs * scales.unsqueeze(1)).mean(dim=0))
+
         return torch.clone(self.momentum).detach()
     
     def __str__(self):
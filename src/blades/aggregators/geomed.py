@@ -7,28 +7,19 @@ from blades.client import BladesClient
 from .mean import _BaseAggregator
 
 
-def _compute_euclidean_distance(v1, v2):
-    return (v1 - v2).norm()
-
-
 def smoothed_weiszfeld(weights, alphas, z, eps=1e-6, T=5):
-    m = len(weights)
-    if len(alphas) != m:
+    if len(alphas) != len(weights):
         raise ValueError
-    
+
     if eps < 0:
         raise ValueError
-    
+
+    weights = torch.stack(list(weights)) if not isinstance(weights, torch.Tensor) else weights
+    alphas = torch.as_tensor(alphas, dtype=weights.dtype, device=weights.device)
     for t in range(T):
-        betas = []
-        for k in range(m):
-            distance = _compute_euclidean_distance(z, weights[k])
-            betas.append(max(eps, alphas[k] / max(distance, eps)))
-        
-        z = 0
-        for w, beta in zip(weights, betas):
-            z += w * beta
-        z /= sum(betas)
+        distances = torch.linalg.vector_norm(weights - z, dim=1).clamp(min=eps)
+        betas = (alphas / distances).clamp(min=eps)
+        z = betas @ weights / betas.sum()
     return z
 
 
@@ -59,26 +50,27 @@ class Geomed(_BaseAggregator):
         super(Geomed, self).__init__()
     
     def _geometric_median_objective(self, median, points, alphas):
-        return sum([alpha * _compute_euclidean_distance(median, p) for alpha, p in zip(alphas, points)])
-    
+        if not isinstance(alphas, torch.Tensor):
+            alphas = torch.as_tensor(alphas, dtype=median.dtype, device=median.device)
+        return torch.dot(alphas, torch.linalg.vector_norm(points - median, dim=1))
+
     def __call__(self, inputs: Union[List[BladesClient], List[torch.Tensor]], weights=None):
         updates = self._get_updates(inputs)
         if weights is None:
             weights = np.ones(len(updates)) / len(updates)
+        weights = torch.as_tensor(weights, dtype=updates.dtype, device=updates.device)
         median = updates.mean(dim=0)
         num_oracle_calls = 1
         obj_val = self._geometric_median_objective(median, updates, weights)
         for i in range(self.maxiter):
             prev_median, prev_obj_val = median, obj_val
-            weights = np.asarray(
-                [max(self.eps, alpha / max(self.eps, _compute_euclidean_distance(median, p).item())) for alpha, p in
-                 zip(weights, updates)],
-                dtype=weights.dtype)
+            distances = torch.linalg.vector_norm(updates - median, dim=1).clamp(min=self.eps)
+            weights = (weights / distances).clamp(min=self.eps)
             weights = weights / weights.sum()
-            median = torch.sum(torch.vstack([w * beta for w, beta in zip(updates, weights)]), dim=0)
+            median = weights @ updates
             num_oracle_calls += 1
             obj_val = self._geometric_median_objective(median, updates, weights)
             if abs(prev_obj_val - obj_val) < self.ftol * obj_val:
                 break
-        
+
         return median
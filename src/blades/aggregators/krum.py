@@ -66,27 +66,29 @@ def _multi_krum(distances, n, f, m):
     return list(map(lambda x: x[0], sorted_scores))[:m]
 
 
-def _compute_euclidean_distance(v1, v2):
-    return (v1 - v2).norm()
-
-
 def _pairwise_euclidean_distances(vectors):
-    """Compute the pairwise euclidean distance.
+    """Compute the pairwise squared euclidean distance.
 
     Arguments:
-        vectors {list} -- A list of vectors.
+        vectors -- A stacked tensor or a list of vectors.
 
     Returns:
-        dict -- A dict of dict of distances {i:{j:distance}}
+        dict -- A dict of dict of squared distances {i:{j:distance}}
     """
+    if not isinstance(vectors, torch.Tensor):
+        vectors = torch.stack([v.flatten() for v in vectors])
+    vectors = vectors.reshape(len(vectors), -1)
+
+    # ||a - b||^2 = ||a||^2 + ||b||^2 - 2 a.b, computed for all pairs with one
+    # Gram matrix instead of one kernel per pair.
+    sq_norms = (vectors * vectors).sum(dim=1)
+    sq_dist = (sq_norms.unsqueeze(0) + sq_norms.unsqueeze(1) - 2.0 * vectors @ vectors.t()).clamp(min=0)
+    sq_dist = sq_dist.cpu().numpy()
+
     n = len(vectors)
-    vectors = [v.flatten() for v in vectors]
-    
     distances = {}
     for i in range(n - 1):
-        distances[i] = {}
-        for j in range(i + 1, n):
-            distances[i][j] = _compute_euclidean_distance(vectors[i], vectors[j]) ** 2
+        distances[i] = {j: sq_dist[i, j] for j in range(i + 1, n)}
     return distances
 
 
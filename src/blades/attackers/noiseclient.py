@@ -19,7 +19,7 @@ class NoiseClient(ByzantineClient):
         self._noise_std = std
     
     def omniscient_callback(self, simulator):
-        self._state['saved_update'] = torch.normal(self._noise_mean,
-                                                   self._noise_std,
-                                                   size=super().get_update().shape
-                                                   ).to('cpu')
+        self.save_update(torch.normal(self._noise_mean,
+                                      self._noise_std,
+                                      size=super().get_update().shape
+                                      ).to('cpu'))
@@ -9,9 +9,10 @@ class SignflippingClient(ByzantineClient):
     
     def local_training(self, data_batches):
         for data, target in data_batches:
-            data, target = data.to(self.device), target.to(self.device)
+            data = data.to(self.device, non_blocking=True)
+            target = target.to(self.device, non_blocking=True)
             data, target = self.on_train_batch_begin(data=data, target=target)
-            self.optimizer.zero_grad()
+            self.optimizer.zero_grad(set_to_none=True)
             
             output = self.model(data)
             loss = torch.clamp(self.loss_func(output, target), 0, 1e5)
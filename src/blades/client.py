@@ -1,8 +1,9 @@
 import copy
 import logging
 from collections import defaultdict
-from typing import Optional
+from typing import Optional, Union
 
+import numpy as np
 import ray.train as train
 import torch
 import torch.nn as nn
@@ -22,20 +23,30 @@ class BladesClient(object):
     _is_byzantine: bool = False
     _is_trusted: bool = False
     device: str = 'cpu'
-    
+
+    # Shared across all clients: loggers are process-wide singletons anyway,
+    # and the loss modules are stateless, so per-client copies only add to
+    # what Ray has to serialize with each client.
+    _json_logger = logging.getLogger("stats")
+    debug_logger = logging.getLogger("debug")
+    _loss_functions = {
+        'crossentropy': nn.modules.loss.CrossEntropyLoss(),
+    }
+
     def __init__(
             self,
             id: Optional[str] = None,
             device: Optional[str] = 'cpu',
     ):
         self._state = defaultdict(dict)
+        self._flat_saved = None
+        self._flat_current = None
+        self._flat_offsets = None
         self.set_id(id)
         self.device = device
         
         self._running = {}
-        
-        self._json_logger = logging.getLogger("stats")
-        self.debug_logger = logging.getLogger("debug")
+        self._test_loader = None
     
     def set_id(self, id: str) -> None:
         r"""Sets the unique id of the client.
@@ -99,13 +110,14 @@ class BladesClient(object):
             g['lr'] = lr
 
     def set_loss(self, loss_func='crossentropy'):
-        if loss_func == 'crossentropy':
-            self.loss_func = nn.modules.loss.CrossEntropyLoss()
-        else:
+        if loss_func not in self._loss_functions:
             raise NotImplementedError
+        self.loss_func = self._loss_functions[loss_func]
     
     def set_para(self, model):
-        state_dict = model.state_dict()
+        # Accept a state dict directly so callers that sync many clients to
+        # the same global model can extract it once instead of per client.
+        state_dict = model if isinstance(model, dict) else model.state_dict()
         self.model.load_state_dict(state_dict)
     
     def __str__(self) -> str:
@@ -127,7 +139,7 @@ class BladesClient(object):
     def on_train_round_end(self) -> None:
         """Called at the end of local optimization.
         """
-        update = (self._get_para(current=True) - self._get_para(current=False))
+        update = self._get_para_delta()
         self.save_update(update)
     
     def on_train_batch_begin(self, data, target, logs=None):
@@ -142,8 +154,15 @@ class BladesClient(object):
         return data, target
     
     def evaluate(self, round_number, test_set, batch_size, metrics, use_actor=True):
-        dataloader = DataLoader(dataset=test_set, batch_size=batch_size)
-        self.model.eval()
+        # Rebuilding a DataLoader every round is wasteful; reuse the cached one
+        # as long as the test set and batch size stay the same.
+        if self._test_loader is None or self._test_loader.dataset is not test_set \
+                or self._test_loader.batch_size != batch_size:
+            self._test_loader = DataLoader(dataset=test_set, batch_size=batch_size,
+                                           pin_memory=torch.device(self.device).type == 'cuda')
+        dataloader = self._test_loader
+        model = self.model.to(self.device)
+        model.eval()
         r = {
             "_meta": {"type": "client_validation"},
             "E": round_number,
@@ -153,19 +172,23 @@ class BladesClient(object):
         for name in metrics:
             r[name] = 0
         
-        with torch.no_grad():
+        outputs = []
+        targets = []
+        with torch.inference_mode():
             for _, (data, target) in enumerate(dataloader):
-                data, target = data.to(self.device), target.to(self.device)
-                output = self.model.to(self.device)(data)
-                r["Loss"] += self.loss_func(output, target).item() * len(target)
-                r["Length"] += len(target)
-                
-                for name, metric in metrics.items():
-                    r[name] += metric(output, target) * len(target)
-        
-        for name in metrics:
-            r[name] /= r["Length"]
-        r["Loss"] /= r["Length"]
+                data = data.to(self.device, non_blocking=True)
+                target = target.to(self.device, non_blocking=True)
+                outputs.append(model(data))
+                targets.append(target)
+
+            # Score the concatenated outputs once instead of accumulating a
+            # weighted average batch by batch.
+            output = torch.cat(outputs)
+            target = torch.cat(targets)
+            r["Length"] = len(target)
+            r["Loss"] = self.loss_func(output, target).item()
+            for name, metric in metrics.items():
+                r[name] = metric(output, target)
         
         self._json_logger.info(r)
         self.debug_logger.info(
@@ -182,9 +205,10 @@ class BladesClient(object):
             :param data_batches: A list of training batches for local training.
         '''
         for data, target in data_batches:
-            data, target = data.to(self.device), target.to(self.device)
+            data = data.to(self.device, non_blocking=True)
+            target = target.to(self.device, non_blocking=True)
             data, target = self.on_train_batch_begin(data=data, target=target)
-            self.optimizer.zero_grad()
+            self.optimizer.zero_grad(set_to_none=True)
             
             output = self.model(data)
             # Clamp loss value to avoid possible 'Nan' gradient with some attack types.
@@ -195,37 +219,78 @@ class BladesClient(object):
     def get_update(self) -> torch.Tensor:
         r'''Returns the saved update of local optimization, represented as a vector.
         '''
-        return torch.nan_to_num(self._get_saved_update())
+        return self._get_saved_update()
     
-    def save_update(self, update: torch.Tensor) -> None:
+    def save_update(self, update: Union[torch.Tensor, np.ndarray]) -> None:
         r"""Sets the update of the client,.
-        
+
         :param update: a vector of local update
         """
-        self._state['saved_update'] = torch.clone(update).detach()
+        saved = self._state['saved_update']
+        if isinstance(saved, torch.Tensor) and tuple(saved.shape) == tuple(update.shape):
+            # Reuse the persistent buffer instead of cloning a fresh
+            # model-size vector every round.
+            if isinstance(update, torch.Tensor):
+                saved.copy_(update.detach())
+            else:
+                np.copyto(saved.numpy(), update)
+        elif isinstance(update, torch.Tensor):
+            self._state['saved_update'] = torch.clone(update).detach()
+        else:
+            # Updates fetched from the Ray object store arrive as read-only
+            # NumPy arrays; ``torch.tensor`` copies them into writable memory.
+            self._state['saved_update'] = torch.tensor(update)
+        # Sanitize once at save time, so that repeated get_update calls can
+        # return the buffer directly instead of re-running nan_to_num.
+        torch.nan_to_num_(self._state['saved_update'])
     
     def _get_saved_update(self) -> torch.Tensor:
         return self._state['saved_update']
     
+    def _trainable_parameters(self) -> list:
+        return [param for param in self.model.parameters() if param.requires_grad]
+
+    def _init_flat_buffers(self) -> None:
+        # Allocate the persistent flat parameter buffers once, and re-allocate
+        # only if the model size or device changes.
+        params = self._trainable_parameters()
+        numels = [param.numel() for param in params]
+        total = sum(numels)
+        device = params[0].device
+        if self._flat_saved is not None and self._flat_saved.numel() == total \
+                and self._flat_saved.device == device:
+            return
+        self._flat_saved = torch.empty(total, dtype=params[0].dtype, device=device)
+        self._flat_current = torch.empty_like(self._flat_saved)
+        self._flat_offsets = []
+        offset = 0
+        for numel in numels:
+            self._flat_offsets.append((offset, numel))
+            offset += numel
+
+    def _fill_flat(self, buffer: torch.Tensor) -> None:
+        for param, (offset, numel) in zip(self._trainable_parameters(), self._flat_offsets):
+            buffer.narrow(0, offset, numel).copy_(param.data.view(-1))
+
     def _save_para(self) -> None:
-        for name, param in self.model.named_parameters():
-            if not param.requires_grad:
-                continue
-            self._state['saved_para'][name] = torch.clone(param.data).detach()
-    
+        self._init_flat_buffers()
+        self._fill_flat(self._flat_saved)
+
     def _get_para(self, current=True) -> torch.Tensor:
-        layer_parameters = []
-        
-        for name, param in self.model.named_parameters():
-            if not param.requires_grad:
-                continue
-            if current:
-                layer_parameters.append(param.data.view(-1))
-            else:
-                saved_param = self._state['saved_para'][name]
-                layer_parameters.append(saved_param.data.view(-1))
-        
-        return torch.cat(layer_parameters).to('cpu')
+        if current:
+            self._init_flat_buffers()
+            self._fill_flat(self._flat_current)
+            flat = self._flat_current
+        else:
+            flat = self._flat_saved
+        return flat if flat.device == torch.device('cpu') else flat.to('cpu')
+
+    def _get_para_delta(self) -> torch.Tensor:
+        r'''Returns the difference between the current and the saved parameters as a single vector.
+        '''
+        self._fill_flat(self._flat_current)
+        delta = self._flat_current.sub_(self._flat_saved)
+        return delta if delta.device == torch.device('cpu') else delta.to('cpu')
 
 
 class ByzantineClient(BladesClient):
@@ -62,14 +62,12 @@ class BladesServer(object):
         :param update: The aggregated update.
         :type update: torch.Tensor
         '''
-        self.zero_grad()
-        beg = 0
-        for group in self.optimizer.param_groups:
-            for p in group["params"]:
-                if not p.requires_grad:
-                    continue
-                end = beg + len(p.data.view(-1))
-                x = update[beg:end].reshape_as(p.data)
-                p.grad = -x.clone().detach()
-                beg = end
+        # The pseudo-gradients are assigned below, so zeroing buffers would be
+        # wasted work; just drop the old grads.
+        self.zero_grad(set_to_none=True)
+        params = [p for group in self.optimizer.param_groups
+                  for p in group["params"] if p.requires_grad]
+        pseudo_grad = -update.detach()
+        for p, grad in zip(params, torch.split(pseudo_grad, [p.numel() for p in params])):
+            p.grad = grad.reshape_as(p.data)
         self.optimizer.step()